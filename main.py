@@ -2,21 +2,34 @@ from __future__ import annotations
 
 import os
 import socket
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 
-from typing import Dict, List
+from typing import Any, Dict, List
 from uuid import UUID
 
 from fastapi import FastAPI, HTTPException
 from fastapi import Query, Path
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
 from models.person import PersonCreate, PersonRead, PersonUpdate, UNIType
 from models.address import AddressCreate, AddressRead, AddressUpdate
 from models.health import Health
-from models.course import CourseCreate, CourseRead, CourseUpdate, CourseNumberType
-from models.department import DepartmentCreate, DepartmentRead, DepartmentUpdate
+from models.course import (
+    CourseCreate,
+    CourseRead,
+    CourseReadListAdapter,
+    CourseUpdate,
+    CourseNumberType,
+    IDType,
+)
+from models.department import (
+    DepartmentCreate,
+    DepartmentRead,
+    DepartmentUpdate,
+)
 
 load_dotenv()
 
@@ -27,15 +40,42 @@ port = int(os.environ.get("FASTAPIPORT", 8000))
 # -----------------------------------------------------------------------------
 persons: Dict[UUID, PersonRead] = {}
 addresses: Dict[UUID, AddressRead] = {}
-courses: Dict[UUID, CourseRead] = {}
-departments: Dict[UUID, DepartmentRead] = {}
+courses: Dict[str, CourseRead] = {}
+departments: Dict[str, DepartmentRead] = {}
+
+# Course/Department models use defer_build, so their own validators are only
+# built if something calls them directly; FastAPI builds what each route needs
+# at registration. Generate the OpenAPI schema up front so /docs is warm.
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.openapi()
+    yield
+
 
 app = FastAPI(
     title="Person/Address API",
     description="Demo FastAPI app using Pydantic v2 models for Person and Address",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+
+class ModelJSONResponse(ORJSONResponse):
+    """Response for Course/Department read models, rendered via ``to_orjson``.
+
+    Handlers return this directly, so FastAPI skips its response_model pass;
+    ``response_model`` on those routes only documents the body. Pre-encoded
+    bytes (e.g. from a list TypeAdapter's ``dump_json``) are sent as-is.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return content.to_orjson()
+
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
@@ -218,31 +258,36 @@ def list_courses(
         filtered_list=[course for course in filtered_list if course.credits==credits]
     if min_strength:
         filtered_list=[course for course in filtered_list if course.strength>=min_strength]
-    return filtered_list
+    return ModelJSONResponse(CourseReadListAdapter.dump_json(filtered_list))
 
 
 
 @app.post("/courses", response_model=CourseRead, status_code=201)
 def create_course(course: CourseCreate):
-    course_read = CourseRead(**course.model_dump())
+    course_read = CourseRead.from_trusted(course.model_dump())
     courses[course_read.id] = course_read
-    return course_read
+    return ModelJSONResponse(course_read, status_code=201)
 
 
 @app.get("/courses/{course_id}", response_model=CourseRead)
-def get_course(course_id: UUID):
+def get_course(course_id: IDType):
     if course_id not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    return courses[course_id]
+    return ModelJSONResponse(courses[course_id])
 
 
 @app.put("/courses/{course_id}", response_model=CourseRead)
-def update_course(course_id: UUID, course_update: CourseUpdate):
-    raise HTTPException(status_code=501, detail="Method not implemented")
+def update_course(course_id: IDType, course_update: CourseUpdate):
+    if course_id not in courses:
+        raise HTTPException(status_code=404, detail="Course not found")
+    stored = courses[course_id].model_dump()
+    stored.update(course_update, updated_at=datetime.now(timezone.utc))
+    courses[course_id] = CourseRead.from_trusted(stored)
+    return ModelJSONResponse(courses[course_id])
 
 
 @app.delete("/courses/{course_id}")
-def delete_course(course_id: UUID):
+def delete_course(course_id: IDType):
     if course_id not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
     del courses[course_id]
@@ -266,25 +311,30 @@ def list_departments(
 
 @app.post("/departments", response_model=DepartmentRead, status_code=201)
 def create_department(dept: DepartmentCreate):
-    dept_read = DepartmentRead(**dept.model_dump())
+    dept_read = DepartmentRead.from_trusted(dept.model_dump())
     departments[dept_read.id] = dept_read
-    return dept_read
+    return ModelJSONResponse(dept_read, status_code=201)
 
 
 @app.get("/departments/{dept_id}", response_model=DepartmentRead)
-def get_department(dept_id: UUID):
+def get_department(dept_id: IDType):
     if dept_id not in departments:
         raise HTTPException(status_code=404, detail="Department not found")
-    return departments[dept_id]
+    return ModelJSONResponse(departments[dept_id])
 
 
 @app.put("/departments/{dept_id}", response_model=DepartmentRead)
-def update_department(dept_id: UUID, dept_update: DepartmentUpdate):
-    raise HTTPException(status_code=501, detail="Method not implemented")
+def update_department(dept_id: IDType, dept_update: DepartmentUpdate):
+    if dept_id not in departments:
+        raise HTTPException(status_code=404, detail="Department not found")
+    stored = departments[dept_id].model_dump()
+    stored.update(dept_update, updated_at=datetime.now(timezone.utc))
+    departments[dept_id] = DepartmentRead.from_trusted(stored)
+    return ModelJSONResponse(departments[dept_id])
 
 
 @app.delete("/departments/{dept_id}")
-def delete_department(dept_id: UUID):
+def delete_department(dept_id: IDType):
     raise HTTPException(status_code=501, detail="Method not implemented")
 
 
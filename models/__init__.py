@@ -0,0 +1,18 @@
+import warnings
+from importlib.machinery import EXTENSION_SUFFIXES
+from pathlib import Path
+
+# course/department may be compiled in place by setup.py; the import system
+# then loads the extension and silently ignores later edits to the .py source.
+_HERE = Path(__file__).parent
+for _name in ("course", "department"):
+    _source = _HERE / f"{_name}.py"
+    for _suffix in EXTENSION_SUFFIXES:
+        _ext = _HERE / f"{_name}{_suffix}"
+        if _ext.exists() and _ext.stat().st_mtime < _source.stat().st_mtime:
+            warnings.warn(
+                f"{_ext.name} is older than {_source.name} and will be imported "
+                "instead of it; run `make build` to rebuild or `make clean` to "
+                "use the source.",
+                stacklevel=2,
+            )
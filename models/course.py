@@ -1,54 +1,136 @@
 from __future__ import annotations
 
-from typing import Optional, Annotated
-from uuid import UUID, uuid4
+import re
+from functools import partial
+from typing import Any, ClassVar, Dict, List, Annotated, Tuple
+from uuid import uuid4
 from datetime import datetime, timezone
-from pydantic import BaseModel, Field, StringConstraints
+import orjson
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    WithJsonSchema,
+)
+from pydantic_core import PydanticCustomError
+from typing_extensions import TypedDict
 
 from .person import UNIType
+from .schemas_openapi import (
+    COURSE_EXAMPLE,
+    COURSE_FIELDS,
+    COURSE_READ_EXAMPLE,
+    COURSE_READ_FIELDS,
+    COURSE_UPDATE_FIELDS,
+    openapi_annotator,
+)
 
 # Columbia University Course Number Format: 4 letter for the department followed by 4 digits for the course number and a letter
 # Ex: COMS4153W
-CourseNumberType = Annotated[str, StringConstraints(pattern=r"^[A-Z]{4}\d{4}[A-Z]$")]
+_COURSE_NUMBER_RE = re.compile(r"^[A-Z]{4}\d{4}[A-Z]$")
+
+
+def _check_course_number(value: str) -> str:
+    if not _COURSE_NUMBER_RE.fullmatch(value):
+        # Same error type/message pydantic gives for StringConstraints(pattern=...).
+        raise PydanticCustomError(
+            "string_pattern_mismatch",
+            "String should match pattern '{pattern}'",
+            {"pattern": _COURSE_NUMBER_RE.pattern},
+        )
+    return value
+
+
+CourseNumberType = Annotated[
+    str,
+    AfterValidator(_check_course_number),
+    WithJsonSchema({"type": "string", "pattern": _COURSE_NUMBER_RE.pattern}),
+]
+
+# Shared bounded ints: negative credits/strength are never valid.
+CreditsType = Annotated[int, Field(ge=0, le=20)]
+StrengthType = Annotated[int, Field(ge=0, le=100000)]
+
+# Server-generated IDs are kept as canonical (lowercase, dashed) UUID strings:
+# the wire format is a string anyway, so this skips uuid.UUID construction and
+# str() on every serialization. Only the canonical dashed spelling is accepted
+# (any case); 32-char hex, braces and "urn:uuid:" forms are rejected.
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+
+
+def _check_id(value: str) -> str:
+    if not _UUID_RE.fullmatch(value):
+        raise ValueError("bad id")
+    return value.lower()
+
+
+def _uuid4_str() -> str:
+    return str(uuid4())
+
+
+IDType = Annotated[
+    str,
+    AfterValidator(_check_id),
+    WithJsonSchema({"type": "string", "format": "uuid"}),
+]
+
+_utc_now = partial(datetime.now, timezone.utc)
+
+
+
+def _orjson_default(obj: Any) -> Any:
+    # Nested pydantic models (e.g. CourseBase inside DepartmentRead) serialize
+    # as their field dict; anything else is a bug, not something to guess at.
+    if isinstance(obj, OrjsonMixin):
+        return obj.to_json_dict()
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class OrjsonMixin:
+    """Adds ``to_orjson`` to read models; used for single-object response bodies."""
+
+    # (attribute, JSON key) per serialized field, computed once per class so
+    # responses don't walk model_fields on every call. Honors Field(exclude=...)
+    # and serialization aliases the way model_dump(by_alias=True) would.
+    _json_fields: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._json_fields = tuple(
+            (name, info.serialization_alias or info.alias or name)
+            for name, info in cls.model_fields.items()
+            if not info.exclude
+        )
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the serialized fields, keyed by their JSON names."""
+        return {key: getattr(self, name) for name, key in self._json_fields}
+
+    def to_orjson(self) -> bytes:
+        """JSON body built from the cached field list, skipping pydantic's serializer."""
+        return orjson.dumps(
+            self.to_json_dict(), default=_orjson_default, option=orjson.OPT_UTC_Z
+        )
+
 
 class CourseBase(BaseModel):
-    course_number: CourseNumberType = Field(
-        ...,
-        description="Columiba University Course Number (Department abbreviation followed by 4 digits and a character).",
-        json_schema_extra={"example": "COMS4153W"},
-    )
-    name: str = Field(
-        ...,
-        description="Course name.",
-        json_schema_extra={"example": "Cloud Computing"},
-    )
-    professor_uni: UNIType = Field(
-        ...,
-        description="UNI of the professor teaching this course.",
-        json_schema_extra={"example": "dj2390"},
-    )
-    credits: int = Field(
-        ...,
-        description="Number of credits earned by taking this course.",
-        json_schema_extra={"example": 3},
-    )
-    strength: int = Field(
-        ...,
-        description="Maximum number of students that can enroll in this course.",
-        json_schema_extra={"example": 120},
-    )
+    course_number: CourseNumberType
+    name: str
+    professor_uni: UNIType
+    credits: CreditsType
+    strength: StrengthType
+
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "course_number": "COMS4153W",
-                    "name": "Cloud Computing",
-                    "professor_uni": "dff9",
-                    "credits": 3,
-                    "strength": 120,
-                }
-            ]
-        }
+        "defer_build": True,
+        "frozen": True,
+        "json_schema_extra": openapi_annotator(COURSE_FIELDS, [COURSE_EXAMPLE]),
     }
 
 
@@ -56,89 +138,52 @@ class CourseCreate(CourseBase):
     """Creation payload for a Course."""
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "course_number": "COMS4705W",
-                    "name": "Natural Language Processing",
-                    "professor_uni": "ab2312",
-                    "credits": 3,
-                    "strength": 90,
-                }
-            ]
-        }
+        "defer_build": True,
+        "frozen": False,
+        "json_schema_extra": openapi_annotator(COURSE_FIELDS, [COURSE_EXAMPLE]),
     }
 
 
-class CourseUpdate(BaseModel):
-    """Partial update for a Course; supply only fields to change."""
+class CourseUpdate(TypedDict, total=False):
+    """Partial update for a Course; supply only fields to change.
 
-    course_number: Optional[UNIType] = Field(
-        None,
-        description="Columiba University Course Number (Department abbreviation followed by 4 digits and a character).",
-        json_schema_extra={"example": "COMS4995W"},
-    )
-    name: Optional[str] = Field(
-        None, description="Course name.", json_schema_extra={"example": "Deep Learning"}
-    )
-    credits: Optional[int] = Field(
-        None,
-        description="Number of credits earned by taking this course.",
-        json_schema_extra={"example": 3},
-    )
-    professor_uni: Optional[UNIType] = Field(
-        ...,
-        description="UNI of the professor teaching this course.",
-        json_schema_extra={"example": "dj2390"},
-    )
-    strength: Optional[int] = Field(
-        None,
-        description="Maximum number of students that can enroll in this course.",
-        json_schema_extra={"example": 100},
+    A TypedDict rather than a model of Optional fields: only the keys actually
+    sent are validated, and the result is a plain dict ready to merge.
+    """
+
+    __pydantic_config__ = ConfigDict(
+        json_schema_extra=openapi_annotator(
+            COURSE_UPDATE_FIELDS, [{"name": "Cloud Computing"}, {"strength": 60}]
+        )
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {"name": "Cloud Computing"},
-                {"strength": 60},
-            ]
-        }
-    }
+    course_number: CourseNumberType
+    name: str
+    credits: CreditsType
+    professor_uni: UNIType
+    strength: StrengthType
 
 
-class CourseRead(CourseBase):
+class CourseRead(OrjsonMixin, CourseBase):
     """Server representation of course returned to clients."""
 
-    id: UUID = Field(
-        default_factory=uuid4,
-        description="Server-generated Course ID.",
-        json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
-    )
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="Creation timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-15T10:20:30Z"},
-    )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="Last update timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-16T12:00:00Z"},
-    )
+    id: IDType = Field(default_factory=_uuid4_str)
+    created_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_utc_now)
+
+    @classmethod
+    def from_trusted(cls, row: Dict[str, Any]) -> CourseRead:
+        """Build from already-validated storage data without re-running validation."""
+        return cls.model_construct(**row)
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "99999999-9999-4999-8999-999999999999",
-                    "created_at": "2025-01-15T10:20:30Z",
-                    "updated_at": "2025-01-16T12:00:00Z",
-                    "course_number": "COMS4153W",
-                    "name": "Cloud Computing",
-                    "professor_uni": "dff9",
-                    "credits": 3,
-                    "strength": 120,
-                }
-            ]
-        }
+        "defer_build": True,
+        "frozen": True,
+        "json_schema_extra": openapi_annotator(
+            COURSE_READ_FIELDS, [COURSE_READ_EXAMPLE]
+        ),
     }
+
+
+# Built once and reused so list endpoints serialize the whole batch in one call.
+CourseReadListAdapter = TypeAdapter(List[CourseRead])
@@ -1,126 +1,121 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field, EmailStr
-from uuid import UUID, uuid4
-from datetime import datetime, timezone
+from __future__ import annotations
+
+import re
+import sys
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Tuple
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    WithJsonSchema,
+)
+from pydantic_core import PydanticCustomError
+from typing_extensions import TypedDict
+from datetime import datetime
 
 from .person import UNIType
-from .course import CourseBase
+from .course import CourseBase, OrjsonMixin, IDType, _utc_now, _uuid4_str
+from .schemas_openapi import (
+    DEPARTMENT_FIELDS,
+    DEPARTMENT_READ_FIELDS,
+    DEPT_EXAMPLE,
+    DEPT_READ_EXAMPLE,
+    openapi_annotator,
+)
+
+# Department codes ("COMS", "IEOR", ...) repeat across every stored department;
+# interning them keeps one shared string object per distinct code in memory.
+DepartmentCodeType = Annotated[str, AfterValidator(sys.intern)]
+
+# Lightweight email check: one precompiled pattern instead of a full
+# email-validator pass on every department payload.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _check_email(value: str) -> str:
+    if not _EMAIL_RE.fullmatch(value):
+        # Same error type/message shape as EmailStr, with the reason spelled out.
+        raise PydanticCustomError(
+            "value_error",
+            "value is not a valid email address: {reason}",
+            {
+                "reason": "expected exactly one @-sign, no whitespace, and a dot "
+                "in the domain (e.g. name@example.edu)."
+            },
+        )
+    return value
+
+
+Email = Annotated[
+    str,
+    AfterValidator(_check_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+# Shared by every Department model so they all reference one list-of-CourseBase
+# annotation (and therefore one nested schema definition).
+CoursesList = List[CourseBase]
+
+# Read-only variant for DepartmentRead, which is never mutated after creation.
+CoursesTuple = Tuple[CourseBase, ...]
+
+
+_COURSE_FIELD_NAMES = tuple(CourseBase.model_fields)
+
+
+@lru_cache(maxsize=1024)
+def _shared_course(values: Tuple[Any, ...]) -> CourseBase:
+    # CourseBase is frozen, so identical courses listed by several departments
+    # can safely be represented by one shared instance. Keyed on values in
+    # fixed field order so the caller's dict key order doesn't matter.
+    return CourseBase.model_construct(**dict(zip(_COURSE_FIELD_NAMES, values)))
+
+
+def _course_values(course: Any) -> Tuple[Any, ...]:
+    # Stored rows hold course dicts; validated update payloads hold CourseBase.
+    if isinstance(course, CourseBase):
+        return tuple(getattr(course, name) for name in _COURSE_FIELD_NAMES)
+    return tuple(course[name] for name in _COURSE_FIELD_NAMES)
 
 
 class DepartmentBase(BaseModel):
-    department_code: str = Field(
-        ..., description="Department code.", json_schema_extra={"example": "COMS"}
-    )
-    name: str = Field(
-        ...,
-        description="Department name.",
-        json_schema_extra={"example": "Computer Science"},
-    )
-    head_of_department: UNIType = Field(
-        ...,
-        description="UNI of the head of the department.",
-        json_schema_extra={"example": "sf2303"},
-    )
-    courses_list: List[CourseBase] = Field(
-        ...,
-        description="All the courses offered by the department.",
-        json_schema_extra={
-            "example": [
-                {
-                    "course_number": "COMS4153W",
-                    "name": "Cloud Computing",
-                    "professor_uni": "dff9",
-                    "credits": 3,
-                    "strength": 120,
-                }
-            ]
-        },
-    )
-    email: EmailStr = Field(
-        ...,
-        description="Email of the department",
-        json_schema_extra={"example": "cs@columbia.edu"},
-    )
+    department_code: DepartmentCodeType
+    name: str
+    head_of_department: UNIType
+    courses_list: CoursesList
+    email: Email
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "department_code": "IEOR",
-                    "name": "Industrial Engineering and Operations Research",
-                    "head_of_department": "sm1231",
-                    "courses_list": [
-                        {
-                            "course_number": "IEOR4121W",
-                            "name": "Marketing Analytics",
-                            "professor_uni": "dd39",
-                            "credits": 3,
-                            "strength": 50,
-                        },
-                        {
-                            "course_number": "IEOR4123W",
-                            "name": "Data Analysis",
-                            "professor_uni": "ce19",
-                            "credits": 3,
-                            "strength": 120,
-                        },
-                    ],
-                    "email": "info@ieor.columbia.edu",
-                }
-            ]
-        }
+        "defer_build": True,
+        "json_schema_extra": openapi_annotator(DEPARTMENT_FIELDS, [DEPT_EXAMPLE]),
     }
 
 
-class DepartmentRead(DepartmentBase):
+class DepartmentRead(OrjsonMixin, DepartmentBase):
     """Server representation returned to clients."""
 
-    id: UUID = Field(
-        default_factory=uuid4,
-        description="Server-generated Department ID.",
-        json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
-    )
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="Creation timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-15T10:20:30Z"},
-    )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="Last update timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-16T12:00:00Z"},
-    )
+    courses_list: CoursesTuple
+    id: IDType = Field(default_factory=_uuid4_str)
+    created_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_utc_now)
+
+    @classmethod
+    def from_trusted(cls, row: Dict[str, Any]) -> DepartmentRead:
+        """Build from already-validated storage data without re-running validation."""
+        courses_list = tuple(
+            _shared_course(_course_values(c)) for c in row["courses_list"]
+        )
+        return cls.model_construct(**{**row, "courses_list": courses_list})
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "99999999-9999-4999-8999-999999999999",
-                    "created_at": "2025-01-15T10:20:30Z",
-                    "updated_at": "2025-01-16T12:00:00Z",
-                    "department_code": "IEOR",
-                    "name": "Industrial Engineering and Operations Research",
-                    "head_of_department": "sm1231",
-                    "courses_list": [
-                        {
-                            "course_number": "IEOR4121W",
-                            "name": "Marketing Analytics",
-                            "professor_uni": "dd39",
-                            "credits": 3,
-                            "strength": 50,
-                        },
-                        {
-                            "course_number": "IEOR4123W",
-                            "name": "Data Analysis",
-                            "professor_uni": "ce19",
-                            "credits": 3,
-                            "strength": 120,
-                        },
-                    ],
-                    "email": "info@ieor.columbia.edu",
-                }
-            ]
-        }
+        "defer_build": True,
+        "frozen": True,
+        "json_schema_extra": openapi_annotator(
+            DEPARTMENT_READ_FIELDS, [DEPT_READ_EXAMPLE]
+        ),
     }
 
 
@@ -128,75 +123,34 @@ class DepartmentCreate(DepartmentBase):
     """Payload for department creation"""
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "department_code": "IEOR",
-                    "name": "Industrial Engineering and Operations Research",
-                    "head_of_department": "sm1231",
-                    "courses_list": [
-                        {
-                            "course_number": "IEOR4121W",
-                            "name": "Marketing Analytics",
-                            "professor_uni": "dd39",
-                            "credits": 3,
-                            "strength": 50,
-                        },
-                        {
-                            "course_number": "IEOR4123W",
-                            "name": "Data Analysis",
-                            "professor_uni": "ce19",
-                            "credits": 3,
-                            "strength": 120,
-                        },
-                    ],
-                    "email": "info@ieor.columbia.edu",
-                }
-            ]
-        }
+        "defer_build": True,
+        "json_schema_extra": openapi_annotator(DEPARTMENT_FIELDS, [DEPT_EXAMPLE]),
     }
 
 
-class DepartmentUpdate(BaseModel):
-    department_code: Optional[str] = Field(
-        ..., description="Department code.", json_schema_extra={"example": "COMS"}
-    )
-    name: Optional[str] = Field(
-        ...,
-        description="Department name.",
-        json_schema_extra={"example": "Computer Science"},
-    )
-    head_of_department: Optional[UNIType] = Field(
-        ...,
-        description="UNI of the head of the department.",
-        json_schema_extra={"example": "sf2303"},
-    )
-    courses_list: Optional[List[CourseBase]] = Field(
-        ...,
-        description="All the courses offered by the department.",
-        json_schema_extra={
-            "example": [
-                {
-                    "course_number": "COMS4153W",
-                    "name": "Cloud Computing",
-                    "professor_uni": "dff9",
-                    "credits": 3,
-                    "strength": 120,
-                }
-            ]
-        },
-    )
-    email: Optional[EmailStr] = Field(
-        ...,
-        description="Email of the department",
-        json_schema_extra={"example": "cs@columbia.edu"},
+class DepartmentUpdate(TypedDict, total=False):
+    """Partial update for a Department; supply only fields to change.
+
+    A TypedDict rather than a model of Optional fields: only the keys actually
+    sent are validated, and the result is a plain dict ready to merge.
+    """
+
+    __pydantic_config__ = ConfigDict(
+        json_schema_extra=openapi_annotator(
+            DEPARTMENT_FIELDS,
+            [{"name": "Industry and Engineering"}, {"head_of_department": "aj9843"}],
+        )
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {"name": "Industry and Engineering"},
-                {"head_of_department": "aj9843"},
-            ]
-        }
-    }
+    department_code: DepartmentCodeType
+    name: str
+    head_of_department: UNIType
+    courses_list: CoursesList
+    email: Email
+
+
+# Built once and reused so list endpoints serialize the whole batch in one call.
+# GET /departments isn't implemented yet, so defer the build until first use.
+DepartmentReadListAdapter = TypeAdapter(
+    List[DepartmentRead], config=ConfigDict(defer_build=True)
+)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+# OpenAPI-only documentation for the Course/Department models.
+#
+# Field descriptions and examples live here instead of in Field(...), so the
+# validating models carry bare FieldInfo objects. They are merged into the JSON
+# schema by openapi_annotator() only when a schema is generated (/openapi.json).
+
+FieldDocs = Dict[str, Dict[str, Any]]
+
+# -----------------------------------------------------------------------------
+# Shared example values
+# -----------------------------------------------------------------------------
+EXAMPLE_COURSE_NUMBER = "COMS4153W"
+EXAMPLE_PROFESSOR_UNI = "dj2390"
+EXAMPLE_ID = "99999999-9999-4999-8999-999999999999"
+EXAMPLE_CREATED_AT = "2025-01-15T10:20:30Z"
+EXAMPLE_UPDATED_AT = "2025-01-16T12:00:00Z"
+
+COURSE_EXAMPLE = {
+    "course_number": EXAMPLE_COURSE_NUMBER,
+    "name": "Cloud Computing",
+    "professor_uni": "dff9",
+    "credits": 3,
+    "strength": 120,
+}
+
+COURSE_READ_EXAMPLE = {
+    "id": EXAMPLE_ID,
+    "created_at": EXAMPLE_CREATED_AT,
+    "updated_at": EXAMPLE_UPDATED_AT,
+    **COURSE_EXAMPLE,
+}
+
+DEPT_EXAMPLE = {
+    "department_code": "IEOR",
+    "name": "Industrial Engineering and Operations Research",
+    "head_of_department": "sm1231",
+    "courses_list": [
+        {
+            "course_number": "IEOR4121W",
+            "name": "Marketing Analytics",
+            "professor_uni": "dd39",
+            "credits": 3,
+            "strength": 50,
+        },
+        {
+            "course_number": "IEOR4123W",
+            "name": "Data Analysis",
+            "professor_uni": "ce19",
+            "credits": 3,
+            "strength": 120,
+        },
+    ],
+    "email": "info@ieor.columbia.edu",
+}
+
+DEPT_READ_EXAMPLE = {
+    "id": EXAMPLE_ID,
+    "created_at": EXAMPLE_CREATED_AT,
+    "updated_at": EXAMPLE_UPDATED_AT,
+    **DEPT_EXAMPLE,
+}
+
+# -----------------------------------------------------------------------------
+# Field documentation
+# -----------------------------------------------------------------------------
+TIMESTAMP_FIELDS: FieldDocs = {
+    "created_at": {
+        "description": "Creation timestamp (UTC).",
+        "example": EXAMPLE_CREATED_AT,
+    },
+    "updated_at": {
+        "description": "Last update timestamp (UTC).",
+        "example": EXAMPLE_UPDATED_AT,
+    },
+}
+
+COURSE_FIELDS: FieldDocs = {
+    "course_number": {
+        "description": "Columiba University Course Number (Department abbreviation followed by 4 digits and a character).",
+        "example": EXAMPLE_COURSE_NUMBER,
+    },
+    "name": {"description": "Course name.", "example": "Cloud Computing"},
+    "professor_uni": {
+        "description": "UNI of the professor teaching this course.",
+        "example": EXAMPLE_PROFESSOR_UNI,
+    },
+    "credits": {
+        "description": "Number of credits earned by taking this course.",
+        "example": 3,
+    },
+    "strength": {
+        "description": "Maximum number of students that can enroll in this course.",
+        "example": 120,
+    },
+}
+
+COURSE_READ_FIELDS: FieldDocs = {
+    **COURSE_FIELDS,
+    **TIMESTAMP_FIELDS,
+    "id": {"description": "Server-generated Course ID.", "example": EXAMPLE_ID},
+}
+
+COURSE_UPDATE_FIELDS: FieldDocs = {
+    **COURSE_FIELDS,
+    "course_number": {**COURSE_FIELDS["course_number"], "example": "COMS4995W"},
+    "name": {**COURSE_FIELDS["name"], "example": "Deep Learning"},
+    "strength": {**COURSE_FIELDS["strength"], "example": 100},
+}
+
+DEPARTMENT_FIELDS: FieldDocs = {
+    "department_code": {"description": "Department code.", "example": "COMS"},
+    "name": {"description": "Department name.", "example": "Computer Science"},
+    "head_of_department": {
+        "description": "UNI of the head of the department.",
+        "example": "sf2303",
+    },
+    "courses_list": {
+        "description": "All the courses offered by the department.",
+        "example": [COURSE_EXAMPLE],
+    },
+    "email": {"description": "Email of the department", "example": "cs@columbia.edu"},
+}
+
+DEPARTMENT_READ_FIELDS: FieldDocs = {
+    **DEPARTMENT_FIELDS,
+    **TIMESTAMP_FIELDS,
+    "id": {"description": "Server-generated Department ID.", "example": EXAMPLE_ID},
+}
+
+
+def openapi_annotator(
+    fields: FieldDocs, examples: List[Dict[str, Any]]
+) -> Callable[[Dict[str, Any], type], None]:
+    """Build a model-level ``json_schema_extra`` that adds field docs and examples."""
+
+    def annotate(schema: Dict[str, Any], cls: type) -> None:
+        properties = schema.get("properties", {})
+        for name, docs in fields.items():
+            if name in properties:
+                properties[name].update(docs)
+        schema["examples"] = examples
+
+    return annotate
@@ -0,0 +1,29 @@
+"""Optional compiled build of the Course/Department models.
+
+    make build      # python setup.py build_ext --inplace
+    make clean      # remove the compiled extensions again
+
+The build drops ``course*.so``/``department*.so`` next to ``models/course.py``
+and ``models/department.py``. Python's import system prefers an extension
+module over the ``.py`` source of the same name, so once built, EDITS TO THOSE
+TWO .py FILES ARE IGNORED until you rebuild (or ``make clean``). ``models``
+warns at import time when an extension is older than its source.
+
+Without Cython (or without running the build) the pure-Python modules are used.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["models/course.py", "models/department.py"],
+        # binding=True keeps functions introspectable, which pydantic needs for
+        # validators and classmethods defined on the models.
+        compiler_directives={"language_level": 3, "binding": True},
+    )
+
+setup(name="columbia-api-models", ext_modules=ext_modules)